@@ -7,24 +7,45 @@ classifies fonts, and downloads them to a local directory.
 """
 
 import argparse
+import asyncio
+import hashlib
 import logging
 import re
 import sys
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from html import unescape
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import ParseResult, urljoin, urlparse
 
 import cssutils
-from bs4 import BeautifulSoup
+import re2
+from curl_cffi import CurlHttpVersion
 from curl_cffi import requests as curl_requests
 from fontTools.ttLib import TTFont
-from pydantic import BaseModel
+from lxml import etree
 
 
 # Suppress cssutils logging noise
 cssutils.log.setLevel(logging.CRITICAL)
 
+# Maximum number of HTTP requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Maximum concurrent font downloads multiplexed over one origin's HTTP/2 connection
+# (matches the common SETTINGS_MAX_CONCURRENT_STREAMS default of 100)
+MAX_STREAMS_PER_ORIGIN = 100
+
+# Chunk size for feeding HTML to the streaming lxml parser
+HTML_FEED_SIZE = 1 << 16
+
+# Write buffer for downloaded font files. Up to MAX_STREAMS_PER_ORIGIN files can be
+# open at once, so keep it small; 64 KiB still coalesces curl's ~16 KiB chunks
+WRITE_BUFFER_SIZE = 1 << 16
+
 
 class FontCategory(str, Enum):
     SERIF = "serif"
@@ -34,7 +55,8 @@ class FontCategory(str, Enum):
     UNKNOWN = "unknown"
 
 
-class FontFace(BaseModel):
+@dataclass(slots=True)
+class FontFace:
     """Represents a parsed @font-face rule."""
 
     family: str
@@ -45,7 +67,8 @@ class FontFace(BaseModel):
     category: FontCategory = FontCategory.UNKNOWN
 
 
-class DownloadResult(BaseModel):
+@dataclass(slots=True)
+class DownloadResult:
     """Result of a font download attempt."""
 
     font: FontFace
@@ -105,38 +128,116 @@ MONO_PATTERNS: list[str] = [
 ]
 
 
+def compile_patterns(patterns: list[str]) -> re.Pattern[str]:
+    """Combine a list of patterns into a single alternation regex."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+MONO_RE = compile_patterns(MONO_PATTERNS)
+SANS_RE = compile_patterns(SANS_PATTERNS)
+SERIF_RE = compile_patterns(SERIF_PATTERNS)
+
+# Patterns for regex-based CSS parsing
+FONT_FACE_RE = re.compile(r"@font-face\s*\{([^}]+)\}", re.IGNORECASE | re.DOTALL)
+FONT_FAMILY_RE = re.compile(r"font-family\s*:\s*['\"]?([^;'\"]+)['\"]?\s*(?:;|$)")
+FONT_SRC_RE = re.compile(r"(?<![\w-])src\s*:\s*((?:url\([^)]*\)|[^;])+)(?:;|$)", re.DOTALL)
+FONT_WEIGHT_RE = re.compile(r"font-weight\s*:\s*([^;]+)(?:;|$)")
+FONT_STYLE_RE = re.compile(r"font-style\s*:\s*([^;]+)(?:;|$)")
+URL_RE = re.compile(r'url\(["\']?([^"\')\s]+)["\']?\)')
+FORMAT_RE = re.compile(r'format\(["\']?([^"\')\s]+)["\']?\)')
+# RE2 is only worth its per-call UTF-8 re-encoding on whole-sheet scans that rarely
+# match: @import is absent from most stylesheets. RE2 has no lookaround.
+IMPORT_RE = re2.compile(r'@import\s+url\(["\']?([^"\')\s]+)["\']?\)')
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# Patterns for the regex-based HTML scanner ("scan, don't parse")
+LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+STYLE_BLOCK_RE = re.compile(r"<style\b[^>]*>(.*?)</style\s*>", re.IGNORECASE | re.DOTALL)
+# Attribute value: double-quoted, single-quoted or bare
+HTML_ATTR_RES = {
+    name: re.compile(rf"""\s{name}\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+    for name in ("rel", "type", "href")
+}
+
+# Source preference for @font-face fallbacks: woff2 > woff > ttf > otf > eot
+FORMAT_PRIORITY: dict[str, int] = {"woff2": 0, "woff": 1, "truetype": 2, "opentype": 3, "embedded-opentype": 4}
+EXTENSION_PRIORITY: tuple[tuple[str, int], ...] = ((".woff2", 0), (".woff", 1), (".ttf", 2), (".otf", 3), (".eot", 4))
+
+# Patterns for building safe output filenames
+UNSAFE_FILENAME_RE = re.compile(r"[^\w\-]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def cached_urlparse(url: str) -> ParseResult:
+    """Memoized urlparse; the same font and stylesheet URLs are parsed repeatedly."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def cached_urljoin(base: str, url: str) -> str:
+    """Memoized urljoin; most url() references share a handful of base URLs."""
+    return urljoin(base, url)
+
+
 def classify_font(*, family: str) -> FontCategory:
     """Classify a font family into a category using heuristics."""
-    family_lower = family.lower()
-    for pattern in MONO_PATTERNS:
-        if re.search(pattern, family_lower):
-            return FontCategory.MONOSPACE
-    for pattern in SANS_PATTERNS:
-        if re.search(pattern, family_lower):
-            return FontCategory.SANS_SERIF
-    for pattern in SERIF_PATTERNS:
-        if re.search(pattern, family_lower):
-            return FontCategory.SERIF
+    return classify_family_lower(family.lower())
+
+
+@lru_cache(maxsize=512)
+def classify_family_lower(family_lower: str) -> FontCategory:
+    """Memoized classifier; weight/style variants repeat the same family many times."""
+    if MONO_RE.search(family_lower):
+        return FontCategory.MONOSPACE
+    if SANS_RE.search(family_lower):
+        return FontCategory.SANS_SERIF
+    if SERIF_RE.search(family_lower):
+        return FontCategory.SERIF
     return FontCategory.UNKNOWN
 
 
 def extract_font_url(*, src_value: str, base_url: str) -> tuple[str, str | None] | None:
     """Extract the font URL and format from a src property value."""
     # Match url(...) with optional format(...)
-    url_match = re.search(r'url\(["\']?([^"\')\s]+)["\']?\)', src_value)
+    url_match = URL_RE.search(src_value)
     if not url_match:
         return None
     raw_url = url_match.group(1)
     # Skip data URIs
     if raw_url.startswith("data:"):
         return None
-    absolute_url = urljoin(base_url, raw_url)
+    absolute_url = cached_urljoin(base_url, raw_url)
     # Extract format if present
-    format_match = re.search(r'format\(["\']?([^"\')\s]+)["\']?\)', src_value)
+    format_match = FORMAT_RE.search(src_value)
     font_format = format_match.group(1) if format_match else None
     return (absolute_url, font_format)
 
 
+def select_font_source(*, src_value: str, base_url: str) -> tuple[str, str | None] | None:
+    """Pick the preferred URL and format among the fallbacks of a src property value."""
+    # Handle multiple url() declarations in src (fallbacks)
+    # Track the best candidate in a single pass; the first source wins ties
+    best: tuple[str, str | None] | None = None
+    best_priority = 6
+    # Split by comma for multiple sources
+    for src_part in src_value.split(","):
+        result = extract_font_url(src_value=src_part.strip(), base_url=base_url)
+        if result:
+            url, fmt = result
+            priority = FORMAT_PRIORITY.get(fmt or "", 5)
+            # Also check file extension if no format specified
+            if fmt is None:
+                # Strip query/fragment once and match the suffix directly,
+                # without building a ParseResult and a Path per candidate
+                path = url.lower().partition("?")[0].partition("#")[0]
+                priority = next((p for ext, p in EXTENSION_PRIORITY if path.endswith(ext)), 5)
+            if priority < best_priority:
+                best = result
+                best_priority = priority
+    return best
+
+
 def parse_font_face_rule(*, rule: cssutils.css.CSSFontFaceRule, base_url: str) -> list[FontFace]:
     """Parse a @font-face rule and extract font information."""
     fonts: list[FontFace] = []
@@ -156,27 +257,10 @@ def parse_font_face_rule(*, rule: cssutils.css.CSSFontFaceRule, base_url: str) -
                 src_value = prop.value
     if not family or not src_value:
         return fonts
-    # Handle multiple url() declarations in src (fallbacks)
-    # We prefer woff2 > woff > ttf > otf > eot
-    format_priority = {"woff2": 0, "woff": 1, "truetype": 2, "opentype": 3, "embedded-opentype": 4}
-    candidates: list[tuple[str, str | None, int]] = []
-    # Split by comma for multiple sources
-    for src_part in src_value.split(","):
-        result = extract_font_url(src_value=src_part.strip(), base_url=base_url)
-        if result:
-            url, fmt = result
-            priority = format_priority.get(fmt or "", 5)
-            # Also check file extension if no format specified
-            if fmt is None:
-                ext = Path(urlparse(url).path).suffix.lower()
-                ext_to_fmt = {".woff2": 0, ".woff": 1, ".ttf": 2, ".otf": 3, ".eot": 4}
-                priority = ext_to_fmt.get(ext, 5)
-            candidates.append((url, fmt, priority))
-    if not candidates:
+    result = select_font_source(src_value=src_value, base_url=base_url)
+    if not result:
         return fonts
-    # Sort by priority and take the best
-    candidates.sort(key=lambda x: x[2])
-    best_url, best_format, _ = candidates[0]
+    best_url, best_format = result
     category = classify_font(family=family)
     fonts.append(
         FontFace(
@@ -193,37 +277,45 @@ def parse_font_face_rule(*, rule: cssutils.css.CSSFontFaceRule, base_url: str) -
 
 def parse_css_for_fonts(*, css_text: str, base_url: str) -> list[FontFace]:
     """Parse CSS text and extract all @font-face declarations."""
-    fonts: list[FontFace] = []
+    # Most stylesheets declare no fonts; a substring scan rules them out cheaply
+    if "@font-face" not in css_text.lower():
+        return []
+    # Fast path: the regex parser handles well-formed @font-face blocks
+    fonts = parse_css_with_regex(css_text=css_text, base_url=base_url)
+    if fonts:
+        return fonts
+    # Fallback: full cssutils parse for CSS the regex parser can't handle
     try:
         sheet = cssutils.parseString(css_text)
         for rule in sheet:
             if isinstance(rule, cssutils.css.CSSFontFaceRule):
                 fonts.extend(parse_font_face_rule(rule=rule, base_url=base_url))
     except Exception:
-        # Fallback: use regex for malformed CSS
-        fonts.extend(parse_css_with_regex(css_text=css_text, base_url=base_url))
+        pass
     return fonts
 
 
 def parse_css_with_regex(*, css_text: str, base_url: str) -> list[FontFace]:
-    """Fallback regex-based parser for @font-face rules."""
+    """Regex-based parser for @font-face rules."""
     fonts: list[FontFace] = []
+    # Drop comments so commented-out declarations (or braces) aren't matched
+    css_text = CSS_COMMENT_RE.sub("", css_text)
     # Match @font-face blocks
-    pattern = r"@font-face\s*\{([^}]+)\}"
-    for match in re.finditer(pattern, css_text, re.IGNORECASE | re.DOTALL):
+    for match in FONT_FACE_RE.finditer(css_text):
         block = match.group(1)
         # Extract properties
-        family_match = re.search(r"font-family\s*:\s*['\"]?([^;'\"]+)['\"]?\s*;", block)
-        src_match = re.search(r"src\s*:\s*([^;]+);", block, re.DOTALL)
-        weight_match = re.search(r"font-weight\s*:\s*([^;]+);", block)
-        style_match = re.search(r"font-style\s*:\s*([^;]+);", block)
-        if not family_match or not src_match:
+        family_match = FONT_FAMILY_RE.search(block)
+        # The last src wins, as in the cascade (e.g. the "bulletproof" double-src syntax)
+        src_values = FONT_SRC_RE.findall(block)
+        weight_match = FONT_WEIGHT_RE.search(block)
+        style_match = FONT_STYLE_RE.search(block)
+        if not family_match or not src_values:
             continue
         family = family_match.group(1).strip()
-        src_value = src_match.group(1).strip()
+        src_value = src_values[-1].strip()
         weight = weight_match.group(1).strip() if weight_match else "400"
         style = style_match.group(1).strip() if style_match else "normal"
-        result = extract_font_url(src_value=src_value, base_url=base_url)
+        result = select_font_source(src_value=src_value, base_url=base_url)
         if result:
             url, fmt = result
             category = classify_font(family=family)
@@ -240,150 +332,274 @@ def parse_css_with_regex(*, css_text: str, base_url: str) -> list[FontFace]:
     return fonts
 
 
-def fetch_page(*, url: str, client: curl_requests.Session) -> str:
+async def fetch_page(*, url: str, client: curl_requests.AsyncSession) -> str:
     """Fetch HTML content from a URL."""
-    response = client.get(url, allow_redirects=True)
+    response = await client.get(url, allow_redirects=True)
     response.raise_for_status()
     return response.text
 
 
-def fetch_css(*, url: str, client: curl_requests.Session) -> str:
+async def fetch_css(*, url: str, client: curl_requests.AsyncSession) -> str:
     """Fetch CSS content from a URL."""
-    response = client.get(url, allow_redirects=True)
+    response = await client.get(url, allow_redirects=True)
     response.raise_for_status()
     return response.text
 
 
-def extract_css_urls(*, html: str, base_url: str) -> list[str]:
-    """Extract CSS stylesheet URLs from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
-    urls: list[str] = []
-    # Find <link rel="stylesheet"> tags
-    for link in soup.find_all("link", rel="stylesheet"):
-        href = link.get("href")
-        if href:
-            urls.append(urljoin(base_url, href))
-    # Find <link> with type="text/css"
-    for link in soup.find_all("link", type="text/css"):
-        href = link.get("href")
-        if href and urljoin(base_url, href) not in urls:
-            urls.append(urljoin(base_url, href))
-    return urls
-
-
-def extract_inline_styles(*, html: str) -> list[str]:
-    """Extract inline <style> content from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
-    styles: list[str] = []
-    for style_tag in soup.find_all("style"):
-        if style_tag.string:
-            styles.append(style_tag.string)
-    return styles
+def extract_stylesheets(*, html: str, base_url: str) -> tuple[list[str], list[str]]:
+    """Extract external CSS URLs and inline <style> content from HTML."""
+    # Fast path: scan for the few tags we need without building a DOM
+    css_urls, styles = extract_stylesheets_with_regex(html=html, base_url=base_url)
+    if css_urls or styles:
+        return (css_urls, styles)
+    # Fallback: a real HTML parse in case the scan missed unusual markup
+    return extract_stylesheets_with_lxml(html=html, base_url=base_url)
 
 
-def download_font(
+def html_attribute(*, tag: str, name: str) -> str | None:
+    """Return the unescaped value of an attribute in a raw HTML start tag."""
+    match = HTML_ATTR_RES[name].search(tag)
+    if not match:
+        return None
+    # Exactly one of the double-quoted, single-quoted or bare groups matched
+    value = next(group for group in match.groups() if group is not None)
+    return unescape(value)
+
+
+def extract_stylesheets_with_regex(*, html: str, base_url: str) -> tuple[list[str], list[str]]:
+    """Regex-based scanner for <link> stylesheets and <style> blocks."""
+    css_urls: list[str] = []
+    seen_css_urls: set[str] = set()
+    for match in LINK_TAG_RE.finditer(html):
+        tag = match.group(0)
+        rel = (html_attribute(tag=tag, name="rel") or "").lower().split()
+        link_type = (html_attribute(tag=tag, name="type") or "").lower()
+        href = html_attribute(tag=tag, name="href")
+        if href and ("stylesheet" in rel or link_type == "text/css"):
+            css_url = cached_urljoin(base_url, href)
+            if css_url not in seen_css_urls:
+                seen_css_urls.add(css_url)
+                css_urls.append(css_url)
+    styles = [match.group(1) for match in STYLE_BLOCK_RE.finditer(html) if match.group(1)]
+    return (css_urls, styles)
+
+
+def extract_stylesheets_with_lxml(*, html: str, base_url: str) -> tuple[list[str], list[str]]:
+    """Streaming lxml parser for <link> stylesheets and <style> blocks.
+
+    The page is fed to an HTMLPullParser in chunks and every element is
+    cleared once it has been inspected, so the tree never holds more than
+    the currently open elements.
+    """
+    css_urls: list[str] = []
+    seen_css_urls: set[str] = set()
+    styles: list[str] = []
+    parser = etree.HTMLPullParser(events=("end",))
+
+    def handle_events() -> None:
+        for _, elem in parser.read_events():
+            if elem.tag == "style":
+                if elem.text:
+                    styles.append(elem.text)
+            elif elem.tag == "link":
+                # <link rel="stylesheet"> or <link type="text/css">
+                rel = (elem.get("rel") or "").lower().split()
+                href = elem.get("href")
+                if href and ("stylesheet" in rel or elem.get("type") == "text/css"):
+                    css_url = cached_urljoin(base_url, href)
+                    if css_url not in seen_css_urls:
+                        seen_css_urls.add(css_url)
+                        css_urls.append(css_url)
+            # Free the element and any already-processed siblings
+            elem.clear(keep_tail=False)
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    try:
+        for start in range(0, len(html), HTML_FEED_SIZE):
+            parser.feed(html[start : start + HTML_FEED_SIZE])
+            handle_events()
+        parser.close()
+        handle_events()
+    except etree.XMLSyntaxError:
+        # Empty or unparseable document; keep whatever was found
+        pass
+    return (css_urls, styles)
+
+
+async def download_font(
     *,
     font: FontFace,
     output_dir: Path,
-    client: curl_requests.Session,
-    index: int,
+    client: curl_requests.AsyncSession,
 ) -> DownloadResult:
-    """Download a single font file."""
+    """Download a single font file, streaming the body straight to disk."""
+    # Determine filename
+    parsed = cached_urlparse(font.url)
+    original_name = Path(parsed.path).name
+    # Clean up filename - remove query params from name
+    if "?" in original_name:
+        original_name = original_name.split("?")[0]
+    # Construct descriptive filename; a short URL hash keeps it unique and stable
+    # across runs, whatever order the stylesheets happened to arrive in
+    safe_family = UNSAFE_FILENAME_RE.sub("_", font.family)
+    safe_weight = WHITESPACE_RE.sub("_", font.weight)
+    ext = Path(original_name).suffix or ".woff2"
+    url_hash = hashlib.sha1(font.url.encode()).hexdigest()[:8]
+    filename = f"{safe_family}-{safe_weight}-{font.style}-{url_hash}{ext}"
+    output_path = output_dir / filename
+    # Stream into a sibling and swap it in on success, so a failed download
+    # never truncates or removes an existing file of the same name
+    part_path = output_path.with_name(f"{filename}.part")
     try:
-        response = client.get(font.url, allow_redirects=True)
-        response.raise_for_status()
-        # Determine filename
-        parsed = urlparse(font.url)
-        original_name = Path(parsed.path).name
-        # Clean up filename - remove query params from name
-        if "?" in original_name:
-            original_name = original_name.split("?")[0]
-        # Construct descriptive filename with index for uniqueness
-        safe_family = re.sub(r"[^\w\-]", "_", font.family)
-        safe_weight = re.sub(r"\s+", "_", font.weight)
-        ext = Path(original_name).suffix or ".woff2"
-        filename = f"{safe_family}-{safe_weight}-{font.style}-{index:02d}{ext}"
-        output_path = output_dir / filename
-        output_path.write_bytes(response.content)
+        async with client.stream("GET", font.url, allow_redirects=True) as response:
+            response.raise_for_status()
+            with part_path.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
+                async for chunk in response.aiter_content():
+                    f.write(chunk)
+        part_path.replace(output_path)
         return DownloadResult(font=font, success=True, path=output_path)
     except Exception as e:
         return DownloadResult(font=font, success=False, error=str(e))
+    finally:
+        # Also runs on cancellation/Ctrl-C; a no-op once replace() has moved the file
+        part_path.unlink(missing_ok=True)
+
+
+async def download_fonts_from_queue(
+    *,
+    queue: asyncio.Queue[FontFace | None],
+    output_dir: Path,
+    timeout: float,
+    cookies: curl_requests.Cookies,
+) -> list[DownloadResult]:
+    """Download fonts as they arrive on ``queue`` until a ``None`` sentinel is received.
+
+    Each origin gets one persistent HTTP/2 session shared by up to
+    MAX_STREAMS_PER_ORIGIN concurrent downloads. Sessions are seeded from
+    ``cookies`` (the page session's jar) when created, so cookies such as
+    Cloudflare's ``cf_clearance`` still reach same-site fonts. Results are
+    returned in queue order.
+    """
+    sessions: dict[str, tuple[curl_requests.AsyncSession, asyncio.Semaphore]] = {}
+    tasks: list[asyncio.Task[DownloadResult]] = []
+
+    async def download(
+        font: FontFace,
+        client: curl_requests.AsyncSession,
+        semaphore: asyncio.Semaphore,
+    ) -> DownloadResult:
+        async with semaphore:
+            return await download_font(font=font, output_dir=output_dir, client=client)
+
+    try:
+        while (font := await queue.get()) is not None:
+            if not tasks:
+                output_dir.mkdir(parents=True, exist_ok=True)
+            # Same-origin fonts share one TLS connection
+            origin = cached_urlparse(font.url).netloc
+            if origin not in sessions:
+                sessions[origin] = (
+                    curl_requests.AsyncSession(
+                        impersonate="chrome",
+                        timeout=timeout,
+                        http_version=CurlHttpVersion.V2_0,
+                        max_clients=MAX_STREAMS_PER_ORIGIN,
+                        cookies=cookies,
+                    ),
+                    asyncio.Semaphore(MAX_STREAMS_PER_ORIGIN),
+                )
+            client, semaphore = sessions[origin]
+            tasks.append(asyncio.create_task(download(font, client, semaphore)))
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for client, _ in sessions.values():
+            await client.close()
 
 
 def convert_woff2_to_ttf(*, woff2_path: Path) -> Path | None:
     """Convert a woff2 font to ttf format. Returns the new path or None on failure."""
     try:
         ttf_path = woff2_path.with_suffix(".ttf")
-        font = TTFont(woff2_path)
-        font.flavor = None  # Remove woff2 compression
-        font.save(ttf_path)
-        font.close()
+        # Skip recomputing bounding boxes and the modified timestamp; untouched
+        # tables are then copied through as raw bytes
+        with TTFont(woff2_path, recalcBBoxes=False, recalcTimestamp=False) as font:
+            font.flavor = None  # Remove woff2 compression
+            font.flavorData = None
+            font.save(ttf_path, reorderTables=True)
         return ttf_path
     except Exception:
         return None
 
 
-def collect_fonts_from_page(
+def convert_woff2_to_ttf_worker(woff2_path: Path) -> tuple[Path, Path | None]:
+    """Process-pool entry point for convert_woff2_to_ttf. Returns (source, ttf path or None)."""
+    return (woff2_path, convert_woff2_to_ttf(woff2_path=woff2_path))
+
+
+async def collect_fonts_from_page(
     *,
     url: str,
-    client: curl_requests.Session,
+    client: curl_requests.AsyncSession,
     log: Callable[[str], None],
+    on_font: Callable[[FontFace], None] | None = None,
 ) -> list[FontFace]:
-    """Collect all fonts referenced by a webpage."""
+    """Collect all fonts referenced by a webpage, deduplicated by URL.
+
+    Fonts are passed to ``on_font`` as soon as their stylesheet is parsed, so
+    callers can start downloading while other stylesheets are still in flight.
+    """
     all_fonts: list[FontFace] = []
+    seen_urls: set[str] = set()
+
+    def add_fonts(fonts: list[FontFace]) -> None:
+        for font in fonts:
+            if font.url not in seen_urls:
+                seen_urls.add(font.url)
+                all_fonts.append(font)
+                if on_font is not None:
+                    on_font(font)
+
     log(f"Fetching page: {url}")
-    html = fetch_page(url=url, client=client)
-    # Extract and parse inline styles
-    inline_styles = extract_inline_styles(html=html)
+    html = await fetch_page(url=url, client=client)
+    css_urls, inline_styles = extract_stylesheets(html=html, base_url=url)
+    # Parse inline styles
     for i, style in enumerate(inline_styles):
         log(f"Parsing inline style block {i + 1}")
-        fonts = parse_css_for_fonts(css_text=style, base_url=url)
-        all_fonts.extend(fonts)
-    # Extract and fetch external CSS
-    css_urls = extract_css_urls(html=html, base_url=url)
+        add_fonts(parse_css_for_fonts(css_text=style, base_url=url))
+    # Fetch external CSS concurrently
     log(f"Found {len(css_urls)} external stylesheet(s)")
-    for css_url in css_urls:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    # Each stylesheet is fetched at most once, which also breaks @import cycles
+    fetched_css: set[str] = set()
+
+    async def fetch_stylesheet(css_url: str, is_import: bool = False) -> None:
+        if css_url in fetched_css:
+            return
+        fetched_css.add(css_url)
+        log(f"Following @import: {css_url}" if is_import else f"Fetching CSS: {css_url}")
         try:
-            log(f"Fetching CSS: {css_url}")
-            css_text = fetch_css(url=css_url, client=client)
-            fonts = parse_css_for_fonts(css_text=css_text, base_url=css_url)
-            all_fonts.extend(fonts)
-            # Also check for @import rules
-            import_pattern = r'@import\s+url\(["\']?([^"\')\s]+)["\']?\)'
-            for match in re.finditer(import_pattern, css_text):
-                import_url = urljoin(css_url, match.group(1))
-                log(f"Following @import: {import_url}")
-                try:
-                    import_css = fetch_css(url=import_url, client=client)
-                    fonts = parse_css_for_fonts(css_text=import_css, base_url=import_url)
-                    all_fonts.extend(fonts)
-                except Exception as e:
-                    log(f"  Failed to fetch @import: {e}")
+            async with semaphore:
+                css_text = await fetch_css(url=css_url, client=client)
         except Exception as e:
-            log(f"  Failed to fetch CSS: {e}")
+            log(f"  Failed to fetch {'@import' if is_import else 'CSS'}: {e}")
+            return
+        # Report fonts in order of arrival rather than waiting for every sheet
+        add_fonts(parse_css_for_fonts(css_text=css_text, base_url=css_url))
+        # Also follow @import rules
+        import_urls = [cached_urljoin(css_url, m.group(1)) for m in IMPORT_RE.finditer(css_text)]
+        await asyncio.gather(*(fetch_stylesheet(u, is_import=True) for u in import_urls))
+
+    await asyncio.gather(*(fetch_stylesheet(u) for u in css_urls))
     return all_fonts
 
 
-def deduplicate_fonts(*, fonts: list[FontFace]) -> list[FontFace]:
-    """Remove duplicate fonts based on URL."""
-    seen_urls: set[str] = set()
-    unique: list[FontFace] = []
-    for font in fonts:
-        if font.url not in seen_urls:
-            seen_urls.add(font.url)
-            unique.append(font)
-    return unique
-
-
-def filter_fonts(
-    *,
-    fonts: list[FontFace],
-    categories: set[FontCategory] | None,
-) -> list[FontFace]:
-    """Filter fonts by category."""
-    if categories is None:
-        return fonts
-    return [f for f in fonts if f.category in categories]
+def matches_categories(*, font: FontFace, categories: set[FontCategory] | None) -> bool:
+    """Check whether a font passes the category filter."""
+    return categories is None or font.category in categories
 
 
 def create_arg_parser() -> argparse.ArgumentParser:
@@ -459,7 +675,7 @@ Examples:
 
 def extract_site_name(*, url: str) -> str:
     """Extract a clean site name from URL for use as directory name."""
-    parsed = urlparse(url)
+    parsed = cached_urlparse(url)
     host = parsed.netloc.lower()
     # Remove www. prefix
     if host.startswith("www."):
@@ -471,6 +687,99 @@ def extract_site_name(*, url: str) -> str:
     return host
 
 
+async def run(
+    *,
+    args: argparse.Namespace,
+    categories: set[FontCategory] | None,
+    log: Callable[[str], None],
+) -> int:
+    """Collect, download and optionally convert the fonts of a webpage."""
+    # Track downloads for potential conversion
+    downloaded_paths: list[Path] = []
+    success_count = 0
+    # Fonts that pass the category filter, in the order they were queued for download
+    fonts: list[FontFace] = []
+    queue: asyncio.Queue[FontFace | None] = asyncio.Queue()
+
+    def enqueue(font: FontFace) -> None:
+        if not matches_categories(font=font, categories=categories):
+            return
+        if not fonts:
+            print("\nFound fonts:\n")
+        fonts.append(font)
+        # Show each font as soon as it is found rather than after all downloads
+        cat_str = f"[{font.category.value}]".ljust(14)
+        print(f"  {cat_str} {font.family} ({font.weight}, {font.style})", flush=True)
+        if args.verbose:
+            print(f"               URL: {font.url}", flush=True)
+        if not args.list_only:
+            queue.put_nowait(font)
+
+    # Create HTTP client with browser TLS fingerprint impersonation
+    async with curl_requests.AsyncSession(impersonate="chrome", timeout=args.timeout) as client:
+        # Downloads start as soon as the first stylesheet is parsed, overlapping CSS fetching
+        downloader = asyncio.create_task(
+            download_fonts_from_queue(
+                queue=queue,
+                output_dir=args.output,
+                timeout=args.timeout,
+                cookies=client.cookies,
+            )
+        )
+        # Collect fonts (already deduplicated during collection)
+        page_error: curl_requests.RequestsError | None = None
+        try:
+            await collect_fonts_from_page(url=args.url, client=client, log=log, on_font=enqueue)
+        except curl_requests.RequestsError as e:
+            page_error = e
+        # No more fonts are coming; let the downloader drain its queue
+        queue.put_nowait(None)
+        if page_error is not None:
+            await downloader
+            print(f"Error fetching page: {page_error}", file=sys.stderr)
+            return 1
+        if not fonts:
+            await downloader
+            print("No fonts found matching the specified criteria.")
+            return 0
+        print(f"\nFound {len(fonts)} font(s).")
+        if args.list_only:
+            await downloader
+            return 0
+        print(f"\nDownloading to: {args.output.resolve()}\n", flush=True)
+        results = await downloader
+    for font, result in zip(fonts, results):
+        if result.success and result.path is not None:
+            print(f"  OK: {result.path.name}")
+            success_count += 1
+            downloaded_paths.append(result.path)
+        else:
+            print(f"  FAILED: {font.family} - {result.error}", file=sys.stderr)
+    print(f"\nDownloaded {success_count}/{len(fonts)} font(s).")
+    # Convert to TTF if requested
+    if args.ttf and downloaded_paths:
+        print("\nConverting to TTF...")
+        convert_count = 0
+        woff2_paths: list[Path] = []
+        for path in downloaded_paths:
+            if path.suffix.lower() == ".woff2":
+                woff2_paths.append(path)
+            else:
+                print(f"  SKIP: {path.name} (not woff2)")
+        # Conversion is CPU-bound, so spread it across all cores
+        with ProcessPoolExecutor() as executor:
+            conversions = list(executor.map(convert_woff2_to_ttf_worker, woff2_paths))
+        for woff2_path, ttf_path in conversions:
+            if ttf_path:
+                print(f"  OK: {ttf_path.name}")
+                woff2_path.unlink()  # Remove original woff2
+                convert_count += 1
+            else:
+                print(f"  FAILED: {woff2_path.name}", file=sys.stderr)
+        print(f"\nConverted {convert_count} font(s) to TTF.")
+    return 0 if success_count == len(fonts) else 1
+
+
 def main() -> int:
     """Main entry point."""
     parser = create_arg_parser()
@@ -498,62 +807,7 @@ def main() -> int:
     def log(msg: str) -> None:
         if args.verbose:
             print(f"[*] {msg}", file=sys.stderr)
-    # Track downloads for potential conversion
-    downloaded_paths: list[Path] = []
-    success_count = 0
-    # Create HTTP client with browser TLS fingerprint impersonation
-    with curl_requests.Session(impersonate="chrome", timeout=args.timeout) as client:
-        # Collect fonts
-        try:
-            fonts = collect_fonts_from_page(url=args.url, client=client, log=log)
-        except curl_requests.RequestsError as e:
-            print(f"Error fetching page: {e}", file=sys.stderr)
-            return 1
-        # Deduplicate and filter
-        fonts = deduplicate_fonts(fonts=fonts)
-        fonts = filter_fonts(fonts=fonts, categories=categories)
-        if not fonts:
-            print("No fonts found matching the specified criteria.")
-            return 0
-        # Display found fonts
-        print(f"\nFound {len(fonts)} font(s):\n")
-        for font in fonts:
-            cat_str = f"[{font.category.value}]".ljust(14)
-            print(f"  {cat_str} {font.family} ({font.weight}, {font.style})")
-            if args.verbose:
-                print(f"               URL: {font.url}")
-        if args.list_only:
-            return 0
-        # Create output directory
-        args.output.mkdir(parents=True, exist_ok=True)
-        print(f"\nDownloading to: {args.output.resolve()}\n")
-        # Download fonts
-        for i, font in enumerate(fonts):
-            result = download_font(font=font, output_dir=args.output, client=client, index=i)
-            if result.success and result.path is not None:
-                print(f"  OK: {result.path.name}")
-                success_count += 1
-                downloaded_paths.append(result.path)
-            else:
-                print(f"  FAILED: {font.family} - {result.error}", file=sys.stderr)
-        print(f"\nDownloaded {success_count}/{len(fonts)} font(s).")
-    # Convert to TTF if requested (outside the session context)
-    if args.ttf and downloaded_paths:
-        print("\nConverting to TTF...")
-        convert_count = 0
-        for woff2_path in downloaded_paths:
-            if woff2_path.suffix.lower() == ".woff2":
-                ttf_path = convert_woff2_to_ttf(woff2_path=woff2_path)
-                if ttf_path:
-                    print(f"  OK: {ttf_path.name}")
-                    woff2_path.unlink()  # Remove original woff2
-                    convert_count += 1
-                else:
-                    print(f"  FAILED: {woff2_path.name}", file=sys.stderr)
-            else:
-                print(f"  SKIP: {woff2_path.name} (not woff2)")
-        print(f"\nConverted {convert_count} font(s) to TTF.")
-    return 0 if success_count == len(fonts) else 1
+    return asyncio.run(run(args=args, categories=categories, log=log))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from download_fonts import (
+    FontCategory,
+    FontFace,
+    classify_font,
+    download_font,
+    extract_stylesheets_with_regex,
+    parse_css_for_fonts,
+)
+
+
+@pytest.mark.parametrize(
+    "css",
+    [
+        """
+        @font-face {
+            font-family: 'Bulletproof';
+            src: url(f.eot);
+            src: url(f.eot?#iefix) format('embedded-opentype'),
+                 url(f.woff2) format('woff2');
+        }
+        """,
+        # Minified, as served by most CDNs
+        "@font-face{font-family:'Bulletproof';src:url(f.eot);"
+        "src:url(f.eot?#iefix) format('embedded-opentype'),url(f.woff2) format('woff2')}",
+    ],
+    ids=["expanded", "minified"],
+)
+def test_parse_css_uses_last_src_declaration(css: str) -> None:
+    fonts = parse_css_for_fonts(css_text=css, base_url="https://example.com/css/site.css")
+    assert len(fonts) == 1
+    assert fonts[0].url == "https://example.com/css/f.woff2"
+    assert fonts[0].format == "woff2"
+
+
+def test_parse_css_ignores_commented_out_src() -> None:
+    css = """
+    @font-face {
+        font-family: 'Commented';
+        src: url(new.woff2) format('woff2');
+        /* src: url(old.ttf); */
+    }
+    """
+    fonts = parse_css_for_fonts(css_text=css, base_url="https://example.com/")
+    assert [font.url for font in fonts] == ["https://example.com/new.woff2"]
+
+
+class FailingClient:
+    """Stand-in session whose requests fail before any body is received."""
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: object) -> AsyncIterator[object]:
+        raise RuntimeError("HTTP Error 404: Not Found")
+        yield
+
+
+def test_failed_download_keeps_existing_file(tmp_path: Path) -> None:
+    existing = tmp_path / f"Menlo-400-normal-{hashlib.sha1(b'https://example.com/menlo.woff2').hexdigest()[:8]}.woff2"
+    existing.write_bytes(b"previous run")
+    font = FontFace(family="Menlo", url="https://example.com/menlo.woff2")
+    result = asyncio.run(download_font(font=font, output_dir=tmp_path, client=FailingClient()))
+    assert not result.success
+    assert existing.read_bytes() == b"previous run"
+    assert list(tmp_path.iterdir()) == [existing]
+
+
+class CancelledMidBodyClient:
+    """Stand-in session whose download is cancelled after the first chunk."""
+
+    class Response:
+        def raise_for_status(self) -> None:
+            pass
+
+        async def aiter_content(self) -> AsyncIterator[bytes]:
+            yield b"partial"
+            raise asyncio.CancelledError
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: object) -> AsyncIterator[object]:
+        yield self.Response()
+
+
+def test_cancelled_download_leaves_no_part_file(tmp_path: Path) -> None:
+    font = FontFace(family="Menlo", url="https://example.com/menlo.woff2")
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(download_font(font=font, output_dir=tmp_path, client=CancelledMidBodyClient()))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("family", "category"),
+    [
+        ("Fira Code", FontCategory.MONOSPACE),
+        ("Open Sans", FontCategory.SANS_SERIF),
+        ("EconomistSerifOsF", FontCategory.SERIF),
+        ("Material Icons", FontCategory.UNKNOWN),
+    ],
+)
+def test_classify_font(family: str, category: FontCategory) -> None:
+    assert classify_font(family=family) == category
+
+
+def test_extract_stylesheets_with_regex() -> None:
+    html = """
+    <html><head>
+    <link rel=stylesheet href=/bare.css>
+    <LINK REL="stylesheet" HREF="https://fonts.googleapis.com/css2?family=Roboto&amp;display=swap">
+    <link type='text/css' href='quoted.css'>
+    <link rel="preload" href="/font.woff2" as="font">
+    <link rel="stylesheet" href="/bare.css">
+    <style>@font-face { font-family: Inline; src: url(i.woff2); }</style>
+    </head><body><p>Ünïcödé</p><STYLE media="print">p { color: red }</STYLE></body></html>
+    """
+    css_urls, styles = extract_stylesheets_with_regex(html=html, base_url="https://example.com/page/")
+    assert css_urls == [
+        "https://example.com/bare.css",
+        "https://fonts.googleapis.com/css2?family=Roboto&display=swap",
+        "https://example.com/page/quoted.css",
+    ]
+    assert styles == ["@font-face { font-family: Inline; src: url(i.woff2); }", "p { color: red }"]